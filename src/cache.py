@@ -1,47 +1,100 @@
 """cache"""
 
+import os
 import sqlite3
 from config import load_configuration
 
-def db_init(db_name='recorded_file_hashes.db'):
+DB_NAME = 'recorded_file_hashes.db'
+
+PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",
+    "PRAGMA busy_timeout=5000",
+)
+
+_SEL_SQL = "SELECT file_hash FROM file_hashes WHERE file_path = ? LIMIT 1"
+_INS_SQL = (
+    "INSERT INTO file_hashes (file_path, file_hash) VALUES (?, ?) "
+    "ON CONFLICT(file_path) DO UPDATE SET file_hash = excluded.file_hash"
+)
+
+_ID_SEL_SQL = "SELECT file_id FROM file_hashes WHERE file_path = ? LIMIT 1"
+_ID_INS_SQL = (
+    "INSERT INTO file_hashes (file_path, file_id) VALUES (?, ?) "
+    "ON CONFLICT(file_path) DO UPDATE SET file_id = excluded.file_id"
+)
+
+_conn = None # pylint: disable=invalid-name
+
+def _get_conn():
     """
-    Connect to the database and return the connection object.
+    Return the shared database connection, opening and initializing it on first use.
     """
+    global _conn # pylint: disable=global-statement
 
-    config = load_configuration()
+    if _conn is None:
+        config = load_configuration()
 
-    conn = sqlite3.connect(config.output_directory + '/' + db_name)
-    conn.execute("CREATE TABLE IF NOT EXISTS file_hashes (file_path TEXT PRIMARY KEY, file_hash TEXT)")
+        conn = sqlite3.connect(os.path.join(config.output_directory, DB_NAME), check_same_thread=False, isolation_level=None)
+        for pragma in PRAGMAS:
+            conn.execute(pragma)
+        conn.execute("CREATE TABLE IF NOT EXISTS file_hashes (file_path TEXT PRIMARY KEY, file_hash TEXT)")
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(file_hashes)")}
+        if 'file_id' not in columns:
+            conn.execute("ALTER TABLE file_hashes ADD COLUMN file_id TEXT")
+        _conn = conn
 
-    return conn
+    return _conn
 
-def get_cached_hash(file_path):
+def _get_cached_value(sql, file_path):
     """
-    Cache the file hash in the database.
+    Return the first column selected by sql for file_path, or False if it is not cached.
     """
-    conn = db_init()
-
-    # check if file_path exists then return it hash else insert
-    cursor = conn.execute("SELECT file_hash FROM file_hashes WHERE file_path = ? LIMIT 1", (file_path,))
+    cursor = _get_conn().execute(sql, (file_path,))
     row = cursor.fetchone()
-    if row:
-        conn.close()
+    if row and row[0]:
         return row[0]
 
     return False
 
-def cache_hash(file_path, file_hash):
+def _executemany_in_transaction(sql, pairs):
     """
-    Cache the file hash in the database.
+    Run sql for every (file_path, value) pair within a single transaction.
     """
+    if not pairs:
+        return
 
+    conn = _get_conn()
+    conn.execute("BEGIN IMMEDIATE")
     try:
-        conn = db_init()
-        conn.execute("INSERT INTO file_hashes (file_path, file_hash) VALUES (?, ?)", (file_path, file_hash))
-        conn.commit()
-        conn.close()
-        return True
-    except sqlite3.IntegrityError as e:
-        conn.close()
-        print(e)
-        return False
+        conn.executemany(sql, pairs)
+    except sqlite3.Error:
+        conn.execute("ROLLBACK")
+        raise
+    conn.execute("COMMIT")
+
+def get_cached_hash(file_path):
+    """
+    Return the cached file hash from the database, or False if it is not cached.
+    """
+    return _get_cached_value(_SEL_SQL, file_path)
+
+def cache_hashes_bulk(pairs):
+    """
+    Cache many (file_path, file_hash) pairs in the database within a single transaction.
+    """
+    _executemany_in_transaction(_INS_SQL, pairs)
+
+def get_cached_id(file_path):
+    """
+    Return the cached file ID from the database, or False if it is not cached.
+    """
+    return _get_cached_value(_ID_SEL_SQL, file_path)
+
+def cache_ids_bulk(pairs):
+    """
+    Cache many (file_path, file_id) pairs in the database within a single transaction.
+    """
+    _executemany_in_transaction(_ID_INS_SQL, pairs)
@@ -16,7 +16,8 @@ DEFAULTS = {
     'check_interval': 60,
     'timeout_connect': 10,
     'timeout_read': 30,
-    'log_level': 'info'
+    'log_level': 'info',
+    'strong_guid': False
 }
 
 def parse_arguments():
@@ -31,6 +32,7 @@ def parse_arguments():
     parser.add_argument('--timeout-connect', type=int, help='Timeout for connecting to the stream in seconds')
     parser.add_argument('--timeout-read', type=int, help='Read timeout in seconds')
     parser.add_argument('--log-level', help='Log level')
+    parser.add_argument('--strong-guid', action='store_true', help='Use SHA-256 based RSS item GUIDs instead of XXH3')
     return vars(parser.parse_args())
 
 def load_configuration():
@@ -46,7 +48,8 @@ def load_configuration():
         'check_interval': cmd_args['check_interval'] or os.getenv('CHECK_INTERVAL') or DEFAULTS['check_interval'],
         'timeout_connect': cmd_args['timeout_connect'] or os.getenv('TIMEOUT_CONNECT') or DEFAULTS['timeout_connect'],
         'timeout_read': cmd_args['timeout_read'] or os.getenv('TIMEOUT_READ') or DEFAULTS['timeout_read'],
-        'log_level': cmd_args['log_level'] or os.getenv('LOG_LEVEL') or DEFAULTS['log_level']
+        'log_level': cmd_args['log_level'] or os.getenv('LOG_LEVEL') or DEFAULTS['log_level'],
+        'strong_guid': cmd_args['strong_guid'] or os.getenv('STRONG_GUID', '').lower() in ('1', 'true', 'yes') or DEFAULTS['strong_guid']
     }
 
     # Converting string paths to absolute paths
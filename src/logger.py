@@ -1,9 +1,38 @@
 """This module contains the logger functions for the application"""
-import json
+import asyncio
+import atexit
+import io
 import sys
-from datetime import datetime
+import time
+from functools import lru_cache
+import orjson
 from config import load_configuration
 
+class _TextStdout(io.RawIOBase):
+    """Byte sink for a sys.stdout replacement that only accepts text, such as io.StringIO"""
+    def writable(self):
+        return True
+
+    def write(self, b):
+        sys.stdout.write(bytes(b).decode('utf-8', 'replace'))
+        return len(b)
+
+    def flush(self):
+        sys.stdout.flush()
+
+# Buffered stdout so every log line does not cost a write() syscall; it is flushed periodically,
+# on WARNING and above, and at exit
+_out = io.BufferedWriter(getattr(sys.stdout, 'buffer', None) or _TextStdout(), buffer_size=65536)
+
+def _flush():
+    """Push buffered log entries through sys.stdout to the terminal or pipe"""
+    _out.flush()
+    _out.raw.flush()
+
+atexit.register(_flush)
+
+FLUSH_LEVELS = {"WARNING", "ERROR", "FATAL"}
+
 # Log levels
 LOG_LEVELS = {
     "DEBUG": 10,
@@ -13,24 +42,83 @@ LOG_LEVELS = {
     "FATAL": 50
 }
 
-def log_event(event, details, level="INFO"):
-    """Log an event to stdout in JSON format"""
-    config = load_configuration()
-    config_level_name = config.log_level.upper()
+# Log entries have a fixed schema, so only the variable parts are JSON encoded
+_LOG_TEMPLATE = b'{"ts":%d,"event":%b,"level":%b,"details":%b}\n'
+_LEVEL_BYTES = {name: orjson.dumps(name) for name in LOG_LEVELS}
+
+@lru_cache(maxsize=1)
+def _cfg():
+    """Load the configuration once and reuse it for every log call"""
+    return load_configuration()
+
+@lru_cache(maxsize=1)
+def _threshold():
+    """Return the numeric log level configured for the application"""
+    config_level_name = _cfg().log_level.upper()
 
     if config_level_name not in LOG_LEVELS:
         raise ValueError(f"Invalid log level {config_level_name} in configuration")
 
-    config_level_number = LOG_LEVELS[config_level_name]
-    event_log_level = LOG_LEVELS.get(level.upper(), 20)  # Defaults to INFO if level is invalid
-
-    if event_log_level >= config_level_number:
-        log_entry = {
-            "timestamp": datetime.utcnow().isoformat(),
-            "event": event,
-            "level": level.upper(),
-            "details": details
-        }
-        json_log_entry = json.dumps(log_entry)
-        print(json_log_entry, file=sys.stdout)
-        sys.stdout.flush()  # Immediately flush the log entry
+    return LOG_LEVELS[config_level_name]
+
+def _log_disabled(event, details): # pylint: disable=unused-argument
+    """Discard an event below the configured log level"""
+
+def _emitter(level):
+    """Return a function that writes events of the given level to stdout in JSON format"""
+    level_bytes = _LEVEL_BYTES.get(level) or orjson.dumps(level)
+    flush_now = level in FLUSH_LEVELS
+
+    def log_enabled(event, details):
+        """Log an event to stdout in JSON format"""
+        _out.write(_LOG_TEMPLATE % (
+            time.time_ns(),
+            orjson.dumps(event),
+            level_bytes,
+            # Header dicts use str subclasses (multidict istr) as keys, which orjson rejects by default
+            orjson.dumps(details, option=orjson.OPT_NON_STR_KEYS)
+        ))
+        if flush_now:
+            _flush()
+    return log_enabled
+
+def _level_logger(level):
+    """Return a log function for one level: a no-op below the configured threshold, a direct writer otherwise"""
+    if LOG_LEVELS[level] < _threshold():
+        return _log_disabled
+    return _emitter(level)
+
+# Specialized per-level log functions, bound once at import time so that `from logger import log_debug`
+# picks up the final binding and disabled levels cost a single call
+log_debug = _level_logger("DEBUG")
+log_info = _level_logger("INFO")
+log_warning = _level_logger("WARNING")
+log_error = _level_logger("ERROR")
+log_fatal = _level_logger("FATAL")
+
+_LEVEL_LOGGERS = {
+    "DEBUG": log_debug,
+    "INFO": log_info,
+    "WARNING": log_warning,
+    "ERROR": log_error,
+    "FATAL": log_fatal
+}
+
+def log_event(event, details, level="INFO"):
+    """Log an event to stdout in JSON format"""
+    level = level.upper()
+    log = _LEVEL_LOGGERS.get(level)
+
+    if log is None:
+        # Unknown levels are filtered as INFO but keep their own name in the output
+        if LOG_LEVELS["INFO"] < _threshold():
+            return
+        log = _emitter(level)
+
+    log(event, details)
+
+async def flush_periodically(interval=0.2):
+    """Flush buffered log entries to stdout every interval seconds"""
+    while True:
+        await asyncio.sleep(interval)
+        _flush()
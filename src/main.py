@@ -3,14 +3,14 @@ import asyncio
 from server import start_server
 from stream_checker import StreamChecker
 from config import load_configuration
-from logger import log_event
+from logger import log_debug, flush_periodically
 
 def main():
     """Main entry point for the Icecast stream checker and ripper"""
     # Load configuration from command line arguments and environment variables
     config = load_configuration()
 
-    log_event("service_start", {"config": config.__dict__}, level="DEBUG")
+    log_debug("service_start", {"config": config.__dict__})
 
     # Create the StreamChecker instance
     checker = StreamChecker(
@@ -27,15 +27,19 @@ def main():
     # Start the health check and file serving server
     server_task = asyncio.ensure_future(start_server(config))
 
-    # Run both tasks in the event loop
+    # Periodically flush buffered log entries
+    flush_task = asyncio.ensure_future(flush_periodically())
+
+    # Run all tasks in the event loop
     loop = asyncio.get_event_loop()
     try:
-        loop.run_until_complete(asyncio.gather(checker_task, server_task))
+        loop.run_until_complete(asyncio.gather(checker_task, server_task, flush_task))
     except KeyboardInterrupt:
         pass
     finally:
         checker_task.cancel()
         server_task.cancel()
+        flush_task.cancel()
         loop.close()
 
 if __name__ == "__main__":
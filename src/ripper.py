@@ -1,10 +1,15 @@
 """Ripper class for recording a stream to a file"""
+import asyncio
 import os
-from datetime import datetime, timedelta
+import time
+from datetime import datetime
 import aiohttp
-from logger import log_event
+from logger import log_info, log_warning, log_error
 from utils import sanitize_filename
 
+WRITE_BUFFER_SIZE = 1024 * 1024
+WRITE_QUEUE_SIZE = 64
+
 class Ripper: # pylint: disable=too-many-instance-attributes
     """Ripper class for recording a stream to a file"""
     def __init__(self, stream_url, output_directory, timeout_connect=10, timeout_read=30):
@@ -25,7 +30,7 @@ class Ripper: # pylint: disable=too-many-instance-attributes
             try:
                 os.makedirs(self.output_directory)
             except Exception as e: # pylint: disable=broad-except
-                log_event("output_directory_error", {"error": str(e)}, level="ERROR")
+                log_error("output_directory_error", {"error": str(e)})
 
         self.start_time = datetime.utcnow()
         domain = self.stream_url.split("//")[-1].split("/")[0]
@@ -39,36 +44,78 @@ class Ripper: # pylint: disable=too-many-instance-attributes
                 async with session.get(self.stream_url) as response:
                     if response.status == 200:
                         self.is_recording = True
-                        log_event("recording_started", {"file_name": self.file_name, "stream_url": self.stream_url})
-                        async for data, _ in response.content.iter_chunks():
-                            if not data:
-                                break
-                            self.last_data_time = datetime.utcnow()
-                            with open(self.file_path, 'ab') as f:
-                                f.write(data)
-                            # Check if timeout exceeded between data chunks
-                            if datetime.utcnow() - self.last_data_time > timedelta(seconds=self.timeout_read):
-                                log_event("timeout_exceeded", {
-                                    "stream_url": self.stream_url,
-                                    "elapsed_seconds": (datetime.utcnow() - self.last_data_time).total_seconds()
-                                }, level="WARNING")
-                                break
+                        log_info("recording_started", {"file_name": self.file_name, "stream_url": self.stream_url})
+                        # Receive chunks here and hand them to a background writer task, so network reads
+                        # keep going while the disk write of earlier chunks is in progress
+                        timeout_read_ns = int(self.timeout_read) * 1_000_000_000
+                        queue = asyncio.Queue(maxsize=WRITE_QUEUE_SIZE)
+                        writer = asyncio.create_task(self._write_chunks(queue))
+                        self.last_data_time = time.monotonic_ns()
+                        try:
+                            async for data, _ in response.content.iter_chunks():
+                                if not data or writer.done():
+                                    break
+                                # Measure the gap since reading resumed after the previous chunk, so time spent
+                                # waiting on a full queue (disk backpressure) never counts as a read timeout
+                                elapsed_ns = time.monotonic_ns() - self.last_data_time
+                                await queue.put(data)
+                                self.last_data_time = time.monotonic_ns()
+                                # Check if timeout exceeded between data chunks
+                                if elapsed_ns > timeout_read_ns:
+                                    log_warning("timeout_exceeded", {
+                                        "stream_url": self.stream_url,
+                                        "elapsed_seconds": elapsed_ns / 1_000_000_000
+                                    })
+                                    break
+                        finally:
+                            if not writer.done():
+                                await queue.put(None)
+                            await writer
 
-                        log_event("recording_finished", {"file_name": self.file_name, "stream_url": self.stream_url})
+                        log_info("recording_finished", {"file_name": self.file_name, "stream_url": self.stream_url})
                     else:
-                        log_event("stream_unavailable", {"http_status": response.status})
+                        log_info("stream_unavailable", {"http_status": response.status})
         except Exception as e: # pylint: disable=broad-except
-            log_event('recording_error', {"error": str(e)}, level="ERROR")
+            log_error('recording_error', {"error": str(e)})
         finally:
             self.is_recording = False
             self.end_recording()
 
+    async def _write_chunks(self, queue):
+        """Write queued chunks to the file until None is received, coalescing queued chunks into one write"""
+        loop = asyncio.get_running_loop()
+        try:
+            chunks = [await queue.get()]
+            if chunks[0] is None:
+                return
+
+            # Create the file only once data arrives, so a stream that ends without data leaves no empty recording
+            with open(self.file_path, 'ab', buffering=WRITE_BUFFER_SIZE) as f:
+                while True:
+                    while chunks[-1] is not None and not queue.empty():
+                        chunks.append(queue.get_nowait())
+
+                    finished = chunks[-1] is None
+                    if finished:
+                        chunks.pop()
+                    if chunks:
+                        await loop.run_in_executor(None, f.write, b''.join(chunks))
+                    if finished:
+                        return
+
+                    chunks = [await queue.get()]
+        except BaseException:
+            # Make room in the queue so a producer blocked on put() can notice the failure
+            while not queue.empty():
+                queue.get_nowait()
+            raise
+
     def end_recording(self):
         """Rename the temporary file to a finished file"""
         if os.path.exists(self.file_path):
             finished_file = self.file_path.replace('.tmp', '')
             os.rename(self.file_path, finished_file)
-            log_event("recording_saved", {
+            log_info("recording_saved", {
                 "file_name": finished_file,
                 "duration": (datetime.utcnow() - self.start_time).total_seconds() if self.start_time else 0
             })
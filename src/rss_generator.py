@@ -1,13 +1,39 @@
 """Generates an RSS feed from the files in the output directory"""
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from yattag import Doc
-from utils import generate_file_hash, file_hash_to_id
+from cache import get_cached_hash, cache_hashes_bulk, get_cached_id, cache_ids_bulk
+from utils import hash_file_contents, fingerprint_file_contents, file_hash_to_id
 
-def generate_rss_feed(files, output_directory, server_host):
+def get_file_ids(file_paths, strong_guid=False):
+    """Returns a file ID for every path, hashing cache misses in parallel and caching them in one transaction"""
+    if strong_guid:
+        get_cached, compute, cache_bulk = get_cached_hash, hash_file_contents, cache_hashes_bulk
+    else:
+        get_cached, compute, cache_bulk = get_cached_id, fingerprint_file_contents, cache_ids_bulk
+
+    digests = {file_path: get_cached(file_path) for file_path in file_paths}
+    misses = [file_path for file_path, digest in digests.items() if not digest]
+    if misses:
+        # Hashing releases the GIL, so independent files are hashed concurrently
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            new_digests = list(zip(misses, executor.map(compute, misses)))
+        digests.update(new_digests)
+        cache_bulk(new_digests)
+
+    if strong_guid:
+        return {file_path: file_hash_to_id(digest) for file_path, digest in digests.items()}
+    return digests
+
+def generate_rss_feed(files, output_directory, server_host, strong_guid=False):
     """Generates an RSS feed from the files in the output directory"""
     doc, tag, text = Doc().tagtext()
 
+    file_paths = {file_name: os.path.join(output_directory, file_name) for file_name in files}
+    file_stats = {file_path: os.stat(file_path) for file_path in file_paths.values()}
+    file_ids = get_file_ids(list(file_paths.values()), strong_guid)
+
     doc.asis('<?xml version="1.0" encoding="UTF-8"?>')
     with tag('rss'):
         doc.attr(
@@ -25,20 +51,18 @@ def generate_rss_feed(files, output_directory, server_host):
             with tag('itunes:block'):
                 text('yes')
 
-            for file_name in files:
-                file_path = os.path.join(output_directory, file_name)
-                file_hash = generate_file_hash(file_path)
-                file_id = file_hash_to_id(file_hash)
+            for file_name, file_path in file_paths.items():
+                file_stat = file_stats[file_path]
 
                 with tag('item'):
-                    with tag('enclosure', url=f'{server_host}/files/{file_name}', length=os.path.getsize(file_path), type='audio/mpeg'):
+                    with tag('enclosure', url=f'{server_host}/files/{file_name}', length=file_stat.st_size, type='audio/mpeg'):
                         pass
                     with tag('title'):
                         text(file_name)
                     with tag('guid', isPermaLink='false'):
-                        text(file_id)
+                        text(file_ids[file_path])
                     with tag('pubDate'):
-                        pub_date = datetime.fromtimestamp(os.path.getctime(file_path)).strftime('%a, %d %b %Y %H:%M:%S UTC')
+                        pub_date = datetime.fromtimestamp(file_stat.st_ctime).strftime('%a, %d %b %Y %H:%M:%S UTC')
                         text(pub_date)
 
     return doc.getvalue()
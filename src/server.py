@@ -1,13 +1,27 @@
 """Server module for the application"""
 import os
 import mimetypes
-from pathlib import Path
+import stat
+from functools import lru_cache
 from aiohttp import web
 import logger
 from rss_generator import generate_rss_feed
 
 routes = web.RouteTableDef()
 
+# Chunk size for the FileResponse fallback when sendfile is not available, and the write buffer high-water mark
+FILE_CHUNK_SIZE = 1024 * 1024
+
+# Rendered RSS feed, reused until the output directory changes
+_rss_cache = {'key': None, 'xml': b''}
+
+# Recordings all have unique names, so memoize on the extension the content type depends on
+@lru_cache(maxsize=128)
+def guess_type(extension):
+    """Guess the content type for a file extension"""
+    content_type, _ = mimetypes.guess_type(f"file{extension}")
+    return content_type
+
 def log_request(request, level="INFO"):
     """Log an HTTP request"""
     logger.log_event("http_request", {
@@ -29,9 +43,19 @@ async def rss_feed(request):
     """RSS feed endpoint"""
     log_request(request)
     output_directory = request.app['config'].output_directory
-    files = [f for f in os.listdir(output_directory) if f.endswith('.mp3')]
-    rss_xml = generate_rss_feed(files, output_directory, request.app['config'].server_host)
-    return web.Response(text=rss_xml, content_type='application/rss+xml')
+
+    # Any file created, renamed or removed in the directory changes its mtime. Stat before listing, so a
+    # change landing in between gives a stale key and the next request rebuilds rather than serving a stale feed
+    dir_mtime_ns = os.stat(output_directory).st_mtime_ns
+    entries = os.listdir(output_directory)
+    cache_key = (dir_mtime_ns, len(entries))
+    if cache_key != _rss_cache['key']:
+        files = [f for f in entries if f.endswith('.mp3')]
+        rss_xml = generate_rss_feed(files, output_directory, request.app['config'].server_host, request.app['config'].strong_guid)
+        _rss_cache['xml'] = rss_xml.encode('utf-8')
+        _rss_cache['key'] = cache_key
+
+    return web.Response(body=_rss_cache['xml'], content_type='application/rss+xml', charset='utf-8')
 
 @routes.get('/files/{file_name}')
 async def serve_file(request):
@@ -42,29 +66,36 @@ async def serve_file(request):
     output_directory = request.app['config'].output_directory
     file_path = os.path.join(output_directory, file_name)
 
-    if not Path(output_directory).joinpath(file_name).resolve().relative_to(Path(output_directory).resolve()):
-        logger.log_event("file_access_denied", {"file_name": file_name}, level="WARNING")
+    if not os.path.realpath(file_path).startswith(request.app['out_dir_resolved'] + os.sep):
+        logger.log_warning("file_access_denied", {"file_name": file_name})
         return web.Response(status=403, text='Access denied')
 
-    if not os.path.exists(file_path):
-        logger.log_event("file_not_found", {"file_name": file_name}, level="WARNING")
+    try:
+        file_stat = os.stat(file_path)
+    except OSError:
+        file_stat = None
+    if file_stat is None or not stat.S_ISREG(file_stat.st_mode):
+        logger.log_warning("file_not_found", {"file_name": file_name})
         return web.Response(status=404, text='File not found')
 
     file = os.path.basename(file_path)
-    content_type, _ = mimetypes.guess_type(file)
+    content_type = guess_type(os.path.splitext(file)[1])
 
     headers = {
         'Content-Type': content_type or 'application/octet-stream',
     }
-    return web.FileResponse(file_path, headers=headers)
+    if request.transport is not None:
+        request.transport.set_write_buffer_limits(high=FILE_CHUNK_SIZE)
+    return web.FileResponse(file_path, chunk_size=FILE_CHUNK_SIZE, headers=headers)
 
 async def start_server(config):
     """Start the web server"""
     app = web.Application()
     app['config'] = config
+    app['out_dir_resolved'] = os.path.realpath(config.output_directory)
     app.add_routes(routes)
     runner = web.AppRunner(app)
     await runner.setup()
     site = web.TCPSite(runner, '0.0.0.0', config.server_port)
-    logger.log_event('server_starting', {'port': config.server_port}, level="DEBUG")
+    logger.log_debug('server_starting', {'port': config.server_port})
     await site.start()
@@ -1,10 +1,13 @@
 """Checking the stream status and starting the ripper"""
 import asyncio
-from aiohttp import ClientSession, ClientTimeout
+from aiohttp import ClientSession, ClientTimeout, TCPConnector
 from ripper import Ripper
-from logger import log_event
+from logger import log_info
 
-class StreamChecker:
+# Statuses returned by servers that do not support HEAD requests
+HEAD_UNSUPPORTED_STATUSES = (405, 501)
+
+class StreamChecker: # pylint: disable=too-many-instance-attributes
     """Checking the stream status and starting the ripper"""
     def __init__(self, stream_url, check_interval, timeout_connect, output_directory, timeout_read=30): # pylint: disable=too-many-arguments
         self.stream_url = stream_url
@@ -14,32 +17,50 @@ class StreamChecker:
         self.output_directory = output_directory
         self.ripper = None
         self.is_stream_live = False
+        self.session = None
+        self._probe_method = "HEAD"
 
     async def check_stream(self, session):
         """Check if the stream is live and start the ripper if needed"""
         try:
             timeout = ClientTimeout(connect=self.timeout_connect)
-            async with session.get(self.stream_url, timeout=timeout, allow_redirects=True) as response:
-                if response.status == 200:
-                    self.is_stream_live = True
-                    log_event("stream_live", {"stream_url": self.stream_url})
-                else:
-                    self.is_stream_live = False
-                    log_event("stream_offline", {"stream_url": self.stream_url})
+            status = await self._probe(session, timeout)
+            if status in (200, 206):
+                self.is_stream_live = True
+                log_info("stream_live", {"stream_url": self.stream_url})
+            else:
+                self.is_stream_live = False
+                log_info("stream_offline", {"stream_url": self.stream_url})
         except asyncio.TimeoutError:
-            log_event("check_stream_timeout", {"stream_url": self.stream_url})
+            log_info("check_stream_timeout", {"stream_url": self.stream_url})
         except Exception as e: # pylint: disable=broad-except
             print(self.stream_url)
-            log_event("check_stream_error", {"error": str(e)})
+            log_info("check_stream_error", {"error": str(e)})
+
+    async def _probe(self, session, timeout):
+        """Return the stream HTTP status without downloading the stream body"""
+        if self._probe_method == "HEAD":
+            async with session.head(self.stream_url, timeout=timeout, allow_redirects=True) as response:
+                if response.status not in HEAD_UNSUPPORTED_STATUSES:
+                    return response.status
+            # Remember that HEAD is not supported and use a one byte ranged GET from now on
+            self._probe_method = "GET"
+
+        async with session.get(self.stream_url, timeout=timeout, allow_redirects=True, headers={"Range": "bytes=0-0"}) as response:
+            return response.status
 
     async def run(self):
         """Start the stream checking and recording loop"""
-        while True:
-            async with ClientSession() as session:
-                await self.check_stream(session)
+        # One session for the whole process, so polls reuse pooled keep-alive connections
+        self.session = ClientSession(connector=TCPConnector(limit=4, keepalive_timeout=60, enable_cleanup_closed=True))
+        try:
+            while True:
+                await self.check_stream(self.session)
 
                 if self.is_stream_live and (self.ripper is None or not self.ripper.is_active()):
                     self.ripper = Ripper(self.stream_url, self.output_directory, self.timeout_read)
                     await self.ripper.start_recording()
 
-            await asyncio.sleep(int(self.check_interval))
+                await asyncio.sleep(int(self.check_interval))
+        finally:
+            await self.session.close()
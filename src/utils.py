@@ -1,36 +1,50 @@
 """Utility functions for the application"""
 import hashlib
+import mmap
+import os
 import string
-from cache import get_cached_hash, cache_hash
+import xxhash
+
+class _FilenameTable(dict):
+    """str.translate table that deletes every character without an explicit mapping"""
+    def __missing__(self, key):
+        return None
+
+_FILENAME_TABLE = _FilenameTable({ord(c): ord(c) for c in f"-_.(){string.ascii_letters}{string.digits}"})
+_FILENAME_TABLE[ord(' ')] = ord('_')  # Replace spaces with underscores
 
 def sanitize_filename(filename):
     """
     Sanitize the filename by removing or replacing invalid characters.
     """
-    valid_chars = f"-_.() {string.ascii_letters}{string.digits}"
-    cleaned_filename = "".join(c for c in filename if c in valid_chars)
-    cleaned_filename = cleaned_filename.replace(' ', '_')  # Replace spaces with underscores
-    return cleaned_filename
+    return filename.translate(_FILENAME_TABLE)
 
-def generate_file_hash(file_path):
+def hash_file_contents(file_path):
     """
-    Generate a hash for file contents to uniquely identify files.
+    Compute the SHA-256 hash of the file contents.
     """
+    with open(file_path, 'rb') as f:
+        if hasattr(hashlib, 'file_digest'):
+            return hashlib.file_digest(f, 'sha256').hexdigest()
 
-    file_hash = get_cached_hash(file_path)
+        # Python < 3.11: hand the whole mapped file to OpenSSL in a single update
+        hasher = hashlib.sha256()
+        if os.fstat(f.fileno()).st_size:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                hasher.update(mm)
 
-    if file_hash:
-        return file_hash
+        return hasher.hexdigest()
 
-    hasher = hashlib.sha256()
+def fingerprint_file_contents(file_path):
+    """
+    Compute the XXH3-128 digest of the file contents.
+    """
     with open(file_path, 'rb') as f:
-        while chunk := f.read(8192):
-            hasher.update(chunk)
-
-    file_hash = hasher.hexdigest()
-    cache_hash(file_path, file_hash)
+        if not os.fstat(f.fileno()).st_size:
+            return xxhash.xxh3_128(b'').hexdigest()
 
-    return file_hash
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return xxhash.xxh3_128(mm).hexdigest()
 
 def file_hash_to_id(file_hash, length=32):
     """